@@ -3,16 +3,71 @@ Automatic Hostel Room Allotment System - Flask Web Application
 Author: Sai Viresh Salpure
 """
 
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, request
 from dataclasses import dataclass, field
+from collections import defaultdict, deque
+import atexit
+import functools
+import gzip
+import hashlib
 import json
 import os
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 app = Flask(__name__)
-DATA_FILE = "hostel_data.json"
+# API JSON is compressed per response when Flask-Compress is installed; the index page ships
+# its own precompressed variants.
+app.config.update(COMPRESS_MIMETYPES=["application/json"], COMPRESS_LEVEL=6)
+if Compress is not None:
+    Compress(app)
+# Data lives next to this file, so every launch mode (gunicorn, dev server, fallback) and
+# every working directory reads and writes the same files.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(BASE_DIR, "hostel_data.json")
+LOG_FILE = os.path.join(BASE_DIR, "hostel_data.log")
+COMPACT_THRESHOLD = 1 << 20  # bytes of log replayed on startup before it is folded into DATA_FILE
+SAVE_DELAY = 0.2  # seconds of quiet before queued log records are written
+SAVE_MAX_DELAY = 1.0  # longest a queued record waits while mutations keep arriving
+STREAM_THRESHOLD = 8 << 20  # snapshot size above which load_data streams records instead of parsing it whole
+ROOM_TYPES = frozenset({"Standard", "Deluxe", "AC"})
+GENDERS = frozenset({"Male", "Female"})  # both matched exactly, as the form submits them
+
+
+def _dumps(obj):
+    # Model instances may be passed directly: orjson serializes dataclasses natively,
+    # the stdlib path goes through their to_dict().
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), default=lambda o: o.to_dict()).encode()
+
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 # -------------------- Models --------------------
-@dataclass
+@dataclass(slots=True)
 class Room:
     number: str
     capacity: int
@@ -20,14 +75,21 @@ class Room:
     type: str = "Standard"
     occupied: int = 0
     students: list = field(default_factory=list)
+    _full: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # One slot per bed, filled in order; occupied doubles as the next free index.
+        self.students = list(self.students) + [None] * (self.capacity - len(self.students))
+        self._full = self.occupied >= self.capacity
 
     def is_available(self): 
-        return self.occupied < self.capacity
+        return not self._full
     
     def add_student(self, sid):
-        if self.is_available():
-            self.students.append(sid)
+        if not self._full:
+            self.students[self.occupied] = sid
             self.occupied += 1
+            self._full = self.occupied >= self.capacity
             return True
         return False
     
@@ -38,7 +100,7 @@ class Room:
             'floor': self.floor,
             'type': self.type,
             'occupied': self.occupied,
-            'students': self.students
+            'students': [sid for sid in self.students if sid is not None]
         }
     
     @staticmethod
@@ -53,7 +115,7 @@ class Room:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Student:
     sid: str
     name: str
@@ -86,39 +148,238 @@ class HostelSystem:
     def __init__(self):
         self.rooms = []
         self.students = []
+        self._student_by_sid = {}
+        self._room_by_number = {}
+        # (position in self.students, student) per lowercased gender, so the allocator
+        # reads its candidates directly and can name them in the log by position.
+        self._by_gender = defaultdict(list)
+        # Running aggregates behind get_stats, kept in step with every mutation.
+        self._total_capacity = 0
+        self._occupied_beds = 0
+        self._allocated_students = 0
+        self._stats_cache = None
+        # Bumped on every mutation; callers key derived data (cached responses) on it.
+        self._version = 0
+        # Guards rooms/students against concurrent request threads; log records are
+        # queued under it so the on-disk order matches the order of mutations.
+        self._lock = threading.RLock()
+        self._pending = []
+        # Times the oldest and newest queued records arrived; the flusher thread sleeps on
+        # _save_wakeup until the queue is due.
+        self._first_queued = self._last_queued = 0.0
+        self._save_wakeup = threading.Condition(self._lock)
+        self._flusher = None
+        # Serialises flushes and compactions so batches reach the log in the order they
+        # were taken; re-entrant because a flush may trigger a compaction.
+        self._save_lock = threading.RLock()
+        # Bumped by each compaction. The snapshot records it and a log opens with the
+        # epoch it extends, so a log already folded into the snapshot is never replayed.
+        self._epoch = 0
         self.load_data()
+        atexit.register(self._flush)
 
-    def save_data(self):
-        data = {
-            'rooms': [r.to_dict() for r in self.rooms],
-            'students': [s.to_dict() for s in self.students]
-        }
-        with open(DATA_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+    def _schedule_save(self, *deltas):
+        # Called under the caller's lock. Records are encoded now so later mutations
+        # cannot leak into them, and each call pushes the write back by SAVE_DELAY, so a
+        # burst of mutations lands in the log as one append.
+        now = time.monotonic()
+        if not self._pending:
+            self._first_queued = now
+        self._last_queued = now
+        self._pending.extend(_dumps(d) + b"\n" for d in deltas)
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+        self._save_wakeup.notify()
+
+    def _flush_loop(self):
+        while True:
+            with self._lock:
+                while True:
+                    if not self._pending:
+                        self._save_wakeup.wait()
+                        continue
+                    # Written after SAVE_DELAY of quiet, but never held past SAVE_MAX_DELAY
+                    # while a steady stream of mutations keeps arriving.
+                    due = min(self._last_queued + SAVE_DELAY, self._first_queued + SAVE_MAX_DELAY)
+                    remaining = due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._save_wakeup.wait(remaining)
+            try:
+                self._flush()
+            except OSError as e:
+                print(f"Error saving data: {e}")
+
+    def _flush(self):
+        with self._save_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                self.save_data(b"".join(batch))
+
+    def save_data(self, records):
+        with open(LOG_FILE, "ab") as f:
+            if f.tell() == 0:
+                f.write(_dumps(("epoch", self._epoch)) + b"\n")
+            f.write(records)
+        if os.path.getsize(LOG_FILE) > COMPACT_THRESHOLD:
+            self.compact()
+
+    def compact(self):
+        with self._save_lock:
+            # Only the copies and the queue swap need the data lock; encoding and disk
+            # I/O happen after it is released so request threads are not held up.
+            with self._lock:
+                epoch = self._epoch + 1
+                data = {
+                    'epoch': epoch,
+                    'rooms': [r.to_dict() for r in self.rooms],
+                    'students': [s.to_dict() for s in self.students]
+                }
+                covered = len(self._pending)
+            tmp = DATA_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, DATA_FILE)
+            # Only now is it safe to move on: if the write failed, the queued records and
+            # the current log still hold everything.
+            with self._lock:
+                self._epoch = epoch
+                # Records queued before the copy are reflected in the snapshot.
+                del self._pending[:covered]
+            # A crash before this line leaves a log from the previous epoch, which
+            # load_data skips.
+            if os.path.exists(LOG_FILE):
+                os.remove(LOG_FILE)
 
     def load_data(self):
         if os.path.exists(DATA_FILE):
             try:
-                with open(DATA_FILE) as f:
-                    data = json.load(f)
-                    self.rooms = [Room.from_dict(r) for r in data.get('rooms', [])]
-                    self.students = [Student.from_dict(s) for s in data.get('students', [])]
+                with open(DATA_FILE, "rb") as f:
+                    if ijson is not None and os.path.getsize(DATA_FILE) > STREAM_THRESHOLD:
+                        self.rooms = [Room.from_dict(r) for r in ijson.items(f, "rooms.item")]
+                        f.seek(0)
+                        self.students = [Student.from_dict(s) for s in ijson.items(f, "students.item")]
+                        f.seek(0)
+                        self._epoch = next(ijson.items(f, "epoch"), 0)
+                    else:
+                        data = _loads(f.read())
+                        self._epoch = data.get('epoch', 0)
+                        self.rooms = [Room.from_dict(r) for r in data.get('rooms', [])]
+                        self.students = [Student.from_dict(s) for s in data.get('students', [])]
             except Exception as e:
                 print(f"Error loading data: {e}")
-                self.rooms, self.students = [], []
+                self.rooms, self.students, self._epoch = [], [], 0
+        if os.path.exists(LOG_FILE):
+            stale = False
+            good = 0  # end of the last record replayed
+            with open(LOG_FILE, "rb") as f:
+                for i, line in enumerate(f):
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError
+                        kind, payload = _loads(line)
+                    except (TypeError, ValueError):
+                        # A torn trailing record from an interrupted write; nothing after it is valid.
+                        print("Error replaying log: truncated record skipped")
+                        break
+                    if i == 0:
+                        # Logs written before epochs existed have no header and count as epoch 0.
+                        log_epoch = payload if kind == "epoch" else 0
+                        stale = log_epoch < self._epoch
+                        if stale:
+                            break
+                        self._epoch = log_epoch
+                    if kind != "epoch":
+                        try:
+                            self._apply(kind, payload)
+                        except (LookupError, TypeError, ValueError) as e:
+                            # The record does not fit the loaded state, e.g. the snapshot failed to load.
+                            print(f"Error replaying log: {e}")
+                            break
+                    good += len(line)
+            if stale:
+                # Already folded into the snapshot; new records must not be appended under it.
+                os.remove(LOG_FILE)
+            elif good < os.path.getsize(LOG_FILE):
+                # Cut the log back to the last record replayed; anything appended after a
+                # record that cannot replay would never be replayed either.
+                with open(LOG_FILE, "r+b") as f:
+                    f.truncate(good)
+        self._reindex()
+
+    def _reindex(self):
+        # setdefault keeps the first entry for a repeated id, matching the old linear scan.
+        # One pass over each list rebuilds both the indexes and the stats totals.
+        self._student_by_sid, self._room_by_number = {}, {}
+        self._by_gender = defaultdict(list)
+        allocated = 0
+        for i, s in enumerate(self.students):
+            self._student_by_sid.setdefault(s.sid, s)
+            self._by_gender[s.gender.lower()].append((i, s))
+            if s.room:
+                allocated += 1
+        capacity = occupied = 0
+        for r in self.rooms:
+            self._room_by_number.setdefault(r.number, r)
+            capacity += r.capacity
+            occupied += r.occupied
+        self._total_capacity = capacity
+        self._occupied_beds = occupied
+        self._allocated_students = allocated
+        self._stats_cache = None
+        self._version += 1
+
+    def _apply(self, kind, payload):
+        if kind == "room":
+            self.rooms.append(Room.from_dict(payload))
+        elif kind == "student":
+            self.students.append(Student.from_dict(payload))
+        elif kind == "allocate":
+            # Positions, not ids: sids and room numbers are not guaranteed unique.
+            for si, ri in payload:
+                s, r = self.students[si], self.rooms[ri]
+                if r.add_student(s.sid):
+                    s.room = r.number
 
     def add_room(self, number, capacity, floor, rtype):
-        self.rooms.append(Room(number, int(capacity), int(floor), rtype))
-        self.save_data()
+        if not isinstance(rtype, str) or rtype not in ROOM_TYPES:
+            raise ValueError(f"Unknown room type: {rtype}")
+        room = Room(number, int(capacity), int(floor), rtype)
+        with self._lock:
+            self.rooms.append(room)
+            self._room_by_number.setdefault(room.number, room)
+            self._total_capacity += room.capacity
+            self._stats_cache = None
+            self._version += 1
+            self._schedule_save(("room", room.to_dict()))
         return True
 
     def add_student(self, sid, name, gender, year):
-        self.students.append(Student(sid, name, gender, int(year)))
-        self.save_data()
+        if not isinstance(gender, str) or gender not in GENDERS:
+            raise ValueError(f"Unknown gender: {gender}")
+        student = Student(sid, name, gender, int(year))
+        with self._lock:
+            self.students.append(student)
+            self._student_by_sid.setdefault(student.sid, student)
+            self._by_gender[student.gender.lower()].append((len(self.students) - 1, student))
+            self._stats_cache = None
+            self._version += 1
+            self._schedule_save(("student", student.to_dict()))
         return True
 
+    @property
+    def version(self):
+        return self._version
+
     def get_student_by_id(self, sid):
-        return next((s for s in self.students if s.sid == sid), None)
+        return self._student_by_sid.get(sid)
+
+    def get_room_by_number(self, number):
+        return self._room_by_number.get(number)
 
     def allocate_rooms(self):
         if not self.rooms: 
@@ -126,39 +387,66 @@ class HostelSystem:
         if not self.students: 
             return {"success": False, "message": "No students available!"}
         
-        log = []
-        sorted_students = sorted(self.students, key=lambda s: s.year, reverse=True)
-        
-        for gender_group in ["male", "female"]:
-            for s in [st for st in sorted_students if st.gender.lower() == gender_group]:
-                allocated = False
-                for r in self.rooms:
-                    if r.is_available() and r.add_student(s.sid):
-                        s.room = r.number
-                        log.append({"student": s.name, "room": r.number, "status": "success"})
-                        allocated = True
-                        break
-                if not allocated:
-                    log.append({"student": s.name, "room": None, "status": "failed"})
-        
-        self.save_data()
+        with self._lock:
+            assigned = []
+            # Every bed is interchangeable, so seating the senior-most students first already
+            # maximises total year priority; only students without a room are candidates, and
+            # students of any gender other than male/female are not allocated.
+            buckets = [
+                sorted(((si, s) for si, s in self._by_gender[gender] if not s.room),
+                       key=lambda p: p[1].year, reverse=True)
+                for gender in ("male", "female")
+            ]
+        
+            # Rooms only fill up during a pass, so first-fit is a queue of the still-open rooms in list order.
+            # When the running totals say every bed is taken, skip the room scan and
+            # let every candidate fall through to "failed".
+            open_rooms = deque()
+            if self._occupied_beds < self._total_capacity:
+                open_rooms.extend((ri, r) for ri, r in enumerate(self.rooms) if r.is_available())
+            # Exactly one entry per candidate.
+            log = [None] * sum(len(bucket) for bucket in buckets)
+            i = 0
+        
+            for bucket in buckets:
+                for si, s in bucket:
+                    if not open_rooms:
+                        log[i] = {"student": s.name, "room": None, "status": "failed"}
+                        i += 1
+                        continue
+                    ri, r = open_rooms[0]
+                    r.add_student(s.sid)
+                    if not r.is_available():
+                        open_rooms.popleft()
+                    s.room = r.number
+                    assigned.append((si, ri))
+                    self._occupied_beds += 1
+                    self._allocated_students += 1
+                    log[i] = {"student": s.name, "room": r.number, "status": "success"}
+                    i += 1
+        
+            if assigned:
+                self._stats_cache = None
+                self._version += 1
+                self._schedule_save(("allocate", assigned))
         return {"success": True, "log": log}
 
     def get_stats(self):
-        total_rooms = len(self.rooms)
-        total_capacity = sum(r.capacity for r in self.rooms)
-        occupied_beds = sum(r.occupied for r in self.rooms)
-        total_students = len(self.students)
-        allocated_students = len([s for s in self.students if s.room])
-        
-        return {
-            "total_rooms": total_rooms,
-            "total_capacity": total_capacity,
-            "occupied_beds": occupied_beds,
-            "total_students": total_students,
-            "allocated_students": allocated_students,
-            "unallocated_students": total_students - allocated_students
-        }
+        stats = self._stats_cache
+        if stats is not None:
+            return stats
+        # Built under the lock so a concurrent mutation cannot be cached over.
+        with self._lock:
+            total_students = len(self.students)
+            stats = self._stats_cache = {
+                "total_rooms": len(self.rooms),
+                "total_capacity": self._total_capacity,
+                "occupied_beds": self._occupied_beds,
+                "total_students": total_students,
+                "allocated_students": self._allocated_students,
+                "unallocated_students": total_students - self._allocated_students
+            }
+        return stats
 
 
 # Global system instance
@@ -188,24 +476,6 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             overflow-x: hidden;
         }
         
-        body::before {
-            content: '';
-            position: fixed;
-            top: -50%;
-            right: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(255,255,255,0.1) 1px, transparent 1px);
-            background-size: 50px 50px;
-            animation: moveGrid 20s linear infinite;
-            pointer-events: none;
-        }
-        
-        @keyframes moveGrid {
-            0% { transform: translate(0, 0); }
-            100% { transform: translate(50px, 50px); }
-        }
-        
         .container {
             max-width: 1400px;
             margin: 0 auto;
@@ -234,589 +504,8 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             color: rgba(255,255,255,0.9);
             font-weight: 300;
         }
-        
-        .stats-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 40px;
-        }
-        
-        .stat-card {
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(20px);
-            border-radius: 20px;
-            padding: 30px;
-            text-align: center;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.15);
-            transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            border: 1px solid rgba(255,255,255,0.3);
-            position: relative;
-            overflow: hidden;
-            animation: fadeInUp 0.6s ease backwards;
-        }
-        
-        .stat-card:nth-child(1) { animation-delay: 0.1s; }
-        .stat-card:nth-child(2) { animation-delay: 0.2s; }
-        .stat-card:nth-child(3) { animation-delay: 0.3s; }
-        .stat-card:nth-child(4) { animation-delay: 0.4s; }
-        .stat-card:nth-child(5) { animation-delay: 0.5s; }
-        .stat-card:nth-child(6) { animation-delay: 0.6s; }
-        
-        .stat-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.1), rgba(118, 75, 162, 0.1));
-            opacity: 0;
-            transition: opacity 0.3s;
-        }
-        
-        .stat-card:hover {
-            transform: translateY(-10px) scale(1.02);
-            box-shadow: 0 30px 80px rgba(0,0,0,0.25);
-        }
-        
-        .stat-card:hover::before {
-            opacity: 1;
-        }
-        
-        .stat-icon {
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            display: inline-block;
-            animation: bounce 2s infinite;
-        }
-        
-        @keyframes bounce {
-            0%, 100% { transform: translateY(0); }
-            50% { transform: translateY(-10px); }
-        }
-        
-        .stat-value {
-            font-size: 2.5rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin: 10px 0;
-        }
-        
-        .stat-label {
-            font-size: 0.9rem;
-            color: #718096;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            font-weight: 600;
-        }
-        
-        .main-card {
-            background: rgba(255, 255, 255, 0.98);
-            backdrop-filter: blur(20px);
-            border-radius: 30px;
-            overflow: hidden;
-            box-shadow: 0 30px 90px rgba(0,0,0,0.2);
-            animation: fadeInUp 0.8s ease 0.3s backwards;
-        }
-        
-        .tabs {
-            display: flex;
-            background: linear-gradient(to right, #f7fafc, #edf2f7);
-            padding: 10px;
-            gap: 10px;
-            border-bottom: 1px solid #e2e8f0;
-        }
-        
-        .tab-btn {
-            flex: 1;
-            padding: 18px 25px;
-            border: none;
-            background: transparent;
-            cursor: pointer;
-            font-size: 1rem;
-            font-weight: 600;
-            color: #718096;
-            border-radius: 15px;
-            transition: all 0.3s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .tab-btn::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            transition: left 0.3s;
-            z-index: -1;
-        }
-        
-        .tab-btn:hover {
-            color: #4a5568;
-            transform: translateY(-2px);
-        }
-        
-        .tab-btn.active {
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            transform: scale(1.05);
-            box-shadow: 0 10px 30px rgba(102, 126, 234, 0.4);
-        }
-        
-        .tab-btn.active::before {
-            left: 0;
-        }
-        
-        .tab-content {
-            display: none;
-            padding: 40px;
-            animation: fadeIn 0.5s ease;
-        }
-        
-        .tab-content.active {
-            display: block;
-        }
-        
-        .section-title {
-            font-size: 1.8rem;
-            font-weight: 700;
-            margin-bottom: 30px;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        .form-container {
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.05), rgba(118, 75, 162, 0.05));
-            border-radius: 20px;
-            padding: 30px;
-            margin-bottom: 40px;
-            border: 2px solid rgba(102, 126, 234, 0.1);
-            transition: all 0.3s;
-        }
-        
-        .form-container:hover {
-            border-color: rgba(102, 126, 234, 0.3);
-            box-shadow: 0 10px 40px rgba(102, 126, 234, 0.1);
-        }
-        
-        .form-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-            gap: 20px;
-            margin-bottom: 25px;
-        }
-        
-        .form-group {
-            position: relative;
-        }
-        
-        .form-group label {
-            display: block;
-            font-size: 0.85rem;
-            font-weight: 600;
-            color: #4a5568;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .form-group input,
-        .form-group select {
-            width: 100%;
-            padding: 14px 18px;
-            border: 2px solid #e2e8f0;
-            border-radius: 12px;
-            font-size: 1rem;
-            font-family: 'Inter', sans-serif;
-            background: white;
-            transition: all 0.3s;
-            color: #2d3748;
-        }
-        
-        .form-group input:focus,
-        .form-group select:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 4px rgba(102, 126, 234, 0.1);
-            transform: translateY(-2px);
-        }
-        
-        .btn {
-            padding: 15px 35px;
-            border: none;
-            border-radius: 12px;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .btn::before {
-            content: '';
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            width: 0;
-            height: 0;
-            border-radius: 50%;
-            background: rgba(255,255,255,0.3);
-            transform: translate(-50%, -50%);
-            transition: width 0.6s, height 0.6s;
-        }
-        
-        .btn:hover::before {
-            width: 300px;
-            height: 300px;
-        }
-        
-        .btn-primary {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
-        }
-        
-        .btn-primary:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 15px 40px rgba(102, 126, 234, 0.4);
-        }
-        
-        .btn-success {
-            background: linear-gradient(135deg, #48bb78 0%, #38a169 100%);
-            color: white;
-            box-shadow: 0 10px 30px rgba(72, 187, 120, 0.3);
-        }
-        
-        .btn-success:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 15px 40px rgba(72, 187, 120, 0.4);
-        }
-        
-        .table-container {
-            overflow-x: auto;
-            border-radius: 15px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        }
-        
-        .data-table {
-            width: 100%;
-            border-collapse: separate;
-            border-spacing: 0;
-            background: white;
-        }
-        
-        .data-table thead tr {
-            background: linear-gradient(135deg, #667eea, #764ba2);
-        }
-        
-        .data-table th {
-            padding: 18px;
-            text-align: left;
-            font-weight: 600;
-            color: white;
-            font-size: 0.9rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .data-table th:first-child {
-            border-top-left-radius: 15px;
-        }
-        
-        .data-table th:last-child {
-            border-top-right-radius: 15px;
-        }
-        
-        .data-table td {
-            padding: 18px;
-            border-bottom: 1px solid #f0f0f0;
-            color: #2d3748;
-            transition: background 0.3s;
-        }
-        
-        .data-table tbody tr {
-            transition: all 0.3s;
-        }
-        
-        .data-table tbody tr:hover {
-            background: linear-gradient(to right, rgba(102, 126, 234, 0.05), rgba(118, 75, 162, 0.05));
-            transform: scale(1.01);
-            box-shadow: 0 4px 15px rgba(0,0,0,0.05);
-        }
-        
-        .badge {
-            display: inline-block;
-            padding: 6px 14px;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .badge-success {
-            background: linear-gradient(135deg, #48bb78, #38a169);
-            color: white;
-            box-shadow: 0 4px 15px rgba(72, 187, 120, 0.3);
-        }
-        
-        .badge-warning {
-            background: linear-gradient(135deg, #ed8936, #dd6b20);
-            color: white;
-            box-shadow: 0 4px 15px rgba(237, 137, 54, 0.3);
-        }
-        
-        .badge-danger {
-            background: linear-gradient(135deg, #f56565, #e53e3e);
-            color: white;
-            box-shadow: 0 4px 15px rgba(245, 101, 101, 0.3);
-        }
-        
-        .badge-info {
-            background: linear-gradient(135deg, #4299e1, #3182ce);
-            color: white;
-            box-shadow: 0 4px 15px rgba(66, 153, 225, 0.3);
-        }
-        
-        .alert {
-            padding: 20px 25px;
-            border-radius: 15px;
-            margin-bottom: 25px;
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            animation: slideInLeft 0.5s ease;
-        }
-        
-        .alert-info {
-            background: linear-gradient(135deg, rgba(66, 153, 225, 0.1), rgba(49, 130, 206, 0.1));
-            border-left: 4px solid #4299e1;
-            color: #2c5282;
-        }
-        
-        .allocation-log {
-            background: white;
-            border-radius: 15px;
-            padding: 25px;
-            margin-top: 30px;
-            max-height: 500px;
-            overflow-y: auto;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.1);
-        }
-        
-        .allocation-log::-webkit-scrollbar {
-            width: 8px;
-        }
-        
-        .allocation-log::-webkit-scrollbar-track {
-            background: #f1f1f1;
-            border-radius: 10px;
-        }
-        
-        .allocation-log::-webkit-scrollbar-thumb {
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            border-radius: 10px;
-        }
-        
-        .log-item {
-            padding: 15px 20px;
-            margin-bottom: 12px;
-            border-radius: 12px;
-            font-size: 0.95rem;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            animation: slideInRight 0.3s ease;
-            transition: all 0.3s;
-        }
-        
-        .log-item:hover {
-            transform: translateX(5px);
-        }
-        
-        .log-item.success {
-            background: linear-gradient(135deg, rgba(72, 187, 120, 0.1), rgba(56, 161, 105, 0.1));
-            border-left: 4px solid #48bb78;
-            color: #22543d;
-        }
-        
-        .log-item.failed {
-            background: linear-gradient(135deg, rgba(245, 101, 101, 0.1), rgba(229, 62, 62, 0.1));
-            border-left: 4px solid #f56565;
-            color: #742a2a;
-        }
-        
-        .room-card {
-            background: white;
-            border-radius: 20px;
-            padding: 25px;
-            margin-bottom: 20px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.08);
-            transition: all 0.3s;
-            border: 2px solid transparent;
-            animation: fadeInUp 0.5s ease;
-        }
-        
-        .room-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 20px 50px rgba(0,0,0,0.15);
-            border-color: rgba(102, 126, 234, 0.3);
-        }
-        
-        .room-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid #f0f0f0;
-        }
-        
-        .room-title {
-            font-size: 1.5rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        .room-info {
-            color: #718096;
-            margin-bottom: 20px;
-            font-size: 0.95rem;
-        }
-        
-        .student-list {
-            list-style: none;
-        }
-        
-        .student-list li {
-            padding: 15px;
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.05), rgba(118, 75, 162, 0.05));
-            margin-bottom: 10px;
-            border-radius: 12px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: all 0.3s;
-            border-left: 3px solid #667eea;
-        }
-        
-        .student-list li:hover {
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.1), rgba(118, 75, 162, 0.1));
-            transform: translateX(5px);
-        }
-        
-        .toast {
-            position: fixed;
-            top: 30px;
-            right: 30px;
-            background: white;
-            padding: 20px 30px;
-            border-radius: 15px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            z-index: 1000;
-            display: none;
-            border-left: 5px solid #48bb78;
-            animation: slideInRight 0.5s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        }
-        
-        .toast.show {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-        
-        .toast::before {
-            content: '✓';
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            width: 30px;
-            height: 30px;
-            background: linear-gradient(135deg, #48bb78, #38a169);
-            color: white;
-            border-radius: 50%;
-            font-weight: bold;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-        
-        @keyframes fadeInUp {
-            from {
-                opacity: 0;
-                transform: translateY(40px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-        
-        @keyframes fadeInDown {
-            from {
-                opacity: 0;
-                transform: translateY(-40px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-        
-        @keyframes slideInRight {
-            from {
-                opacity: 0;
-                transform: translateX(100px);
-            }
-            to {
-                opacity: 1;
-                transform: translateX(0);
-            }
-        }
-        
-        @keyframes slideInLeft {
-            from {
-                opacity: 0;
-                transform: translateX(-100px);
-            }
-            to {
-                opacity: 1;
-                transform: translateX(0);
-            }
-        }
-        
-        @media (max-width: 768px) {
-            .header h1 {
-                font-size: 2.5rem;
-            }
-            .stats-container {
-                grid-template-columns: repeat(2, 1fr);
-            }
-            .form-grid {
-                grid-template-columns: 1fr;
-            }
-            .tabs {
-                flex-wrap: wrap;
-            }
-        }
     </style>
+    <link rel="stylesheet" href="{{ static_url }}/app.css">
 </head>
 <body>
     <div class="container">
@@ -933,7 +622,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     <span style="font-size: 1.5rem;">ℹ️</span>
                     <span>This will automatically allocate rooms to students based on year priority (senior students first) and room availability.</span>
                 </div>
-                <button class="btn btn-success" onclick="allocateRooms()">🚀 Start Allocation</button>
+                <button class="btn btn-success" id="allocateBtn" onclick="allocateRooms()">🚀 Start Allocation</button>
                 <div class="allocation-log" id="allocationLog" style="display: none;"></div>
             </div>
 
@@ -941,6 +630,25 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 <h2 class="section-title">Allocation Report</h2>
                 <button class="btn btn-primary" onclick="loadReport()">🔄 Generate Report</button>
                 <div id="reportContainer" style="margin-top: 30px;"></div>
+                <template id="roomCardTpl">
+                    <div class="room-card">
+                        <div class="room-header">
+                            <div class="room-title"></div>
+                            <span class="badge"></span>
+                        </div>
+                        <div class="room-info">
+                            <strong>Floor:</strong> <span class="room-floor"></span> | <strong>Type:</strong> <span class="room-type"></span>
+                        </div>
+                        <ul class="student-list"></ul>
+                        <p class="room-empty" style="color: #999; text-align: center; padding: 20px;">No students allocated yet</p>
+                    </div>
+                </template>
+                <template id="studentItemTpl">
+                    <li>
+                        <span><strong class="student-name"></strong> (<span class="student-sid"></span>)</span>
+                        <span class="badge badge-info"></span>
+                    </li>
+                </template>
             </div>
         </div>
     </div>
@@ -967,7 +675,10 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
         async function loadStats() {
             const res = await fetch('/api/stats');
-            const stats = await res.json();
+            renderStats(await res.json());
+        }
+
+        function renderStats(stats) {
             document.getElementById('statsContainer').innerHTML = `
                 <div class="stat-card">
                     <div class="stat-icon">🏢</div>
@@ -1017,12 +728,17 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 e.target.reset();
                 loadRooms();
                 loadStats();
+            } else {
+                showToast('❌ ' + result.message);
             }
         }
 
         async function loadRooms() {
             const res = await fetch('/api/rooms');
-            const rooms = await res.json();
+            renderRooms(await res.json());
+        }
+
+        function renderRooms(rooms) {
             const tbody = document.querySelector('#roomsTable tbody');
             tbody.innerHTML = rooms.map(r => `
                 <tr>
@@ -1055,12 +771,17 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 e.target.reset();
                 loadStudents();
                 loadStats();
+            } else {
+                showToast('❌ ' + result.message);
             }
         }
 
         async function loadStudents() {
             const res = await fetch('/api/students');
-            const students = await res.json();
+            renderStudents(await res.json());
+        }
+
+        function renderStudents(students) {
             const tbody = document.querySelector('#studentsTable tbody');
             tbody.innerHTML = students.map(s => `
                 <tr>
@@ -1078,30 +799,37 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         }
 
         async function allocateRooms() {
-            const res = await fetch('/api/allocate', {method: 'POST'});
-            const result = await res.json();
-            const logDiv = document.getElementById('allocationLog');
-            logDiv.style.display = 'block';
-            if (!result.success) {
-                logDiv.innerHTML = `<div class="log-item failed">❌ ${result.message}</div>`;
-                return;
+            // Block double clicks while a run is in flight; the server also coalesces repeats.
+            const btn = document.getElementById('allocateBtn');
+            btn.disabled = true;
+            try {
+                const res = await fetch('/api/allocate', {method: 'POST'});
+                const result = await res.json();
+                const logDiv = document.getElementById('allocationLog');
+                logDiv.style.display = 'block';
+                if (!result.success) {
+                    logDiv.innerHTML = `<div class="log-item failed">❌ ${result.message}</div>`;
+                    return;
+                }
+                logDiv.innerHTML = `
+                    <h3 style="margin-bottom: 20px; font-size: 1.3rem; color: #2d3748;">Allocation Results</h3>
+                    ${result.log.map((l, i) => `
+                        <div class="log-item ${l.status}" style="animation-delay: ${i * 0.05}s">
+                            <span style="font-size: 1.2rem;">${l.status === 'success' ? '✅' : '❌'}</span>
+                            <strong>${l.student}</strong> 
+                            <span style="margin-left: auto;">${l.room ? `→ Room ${l.room}` : '→ No room available'}</span>
+                        </div>
+                    `).join('')}
+                `;
+                showToast('Allocation completed successfully! 🎉');
+                loadStats();
+                setTimeout(() => {
+                    loadStudents();
+                    loadRooms();
+                }, 1000);
+            } finally {
+                btn.disabled = false;
             }
-            logDiv.innerHTML = `
-                <h3 style="margin-bottom: 20px; font-size: 1.3rem; color: #2d3748;">Allocation Results</h3>
-                ${result.log.map((l, i) => `
-                    <div class="log-item ${l.status}" style="animation-delay: ${i * 0.05}s">
-                        <span style="font-size: 1.2rem;">${l.status === 'success' ? '✅' : '❌'}</span>
-                        <strong>${l.student}</strong> 
-                        <span style="margin-left: auto;">${l.room ? `→ Room ${l.room}` : '→ No room available'}</span>
-                    </div>
-                `).join('')}
-            `;
-            showToast('Allocation completed successfully! 🎉');
-            loadStats();
-            setTimeout(() => {
-                loadStudents();
-                loadRooms();
-            }, 1000);
         }
 
         async function loadReport() {
@@ -1112,34 +840,47 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 container.innerHTML = '<div style="text-align: center; padding: 60px; color: #999;">No rooms available</div>';
                 return;
             }
-            container.innerHTML = rooms.map((r, i) => `
-                <div class="room-card" style="animation-delay: ${i * 0.1}s">
-                    <div class="room-header">
-                        <div class="room-title">Room ${r.number}</div>
-                        <span class="badge badge-${r.occupied === r.capacity ? 'danger' : 'success'}">
-                            ${r.occupied}/${r.capacity} Occupied
-                        </span>
-                    </div>
-                    <div class="room-info">
-                        <strong>Floor:</strong> ${r.floor} | <strong>Type:</strong> ${r.type}
-                    </div>
-                    ${r.students.length > 0 ? `
-                        <ul class="student-list">
-                            ${r.students.map(s => `
-                                <li>
-                                    <span><strong>${s.name}</strong> (${s.sid})</span>
-                                    <span class="badge badge-info">Year ${s.year}</span>
-                                </li>
-                            `).join('')}
-                        </ul>
-                    ` : '<p style="color: #999; text-align: center; padding: 20px;">No students allocated yet</p>'}
-                </div>
-            `).join('');
+            // Clone the prebuilt card/item nodes and fill text fields: no HTML parsing per room.
+            const cardTpl = document.getElementById('roomCardTpl').content.firstElementChild;
+            const itemTpl = document.getElementById('studentItemTpl').content.firstElementChild;
+            const frag = document.createDocumentFragment();
+            rooms.forEach((r, i) => {
+                const card = cardTpl.cloneNode(true);
+                card.style.animationDelay = `${i * 0.1}s`;
+                card.querySelector('.room-title').textContent = `Room ${r.number}`;
+                const badge = card.querySelector('.room-header .badge');
+                badge.classList.add(r.occupied === r.capacity ? 'badge-danger' : 'badge-success');
+                badge.textContent = `${r.occupied}/${r.capacity} Occupied`;
+                card.querySelector('.room-floor').textContent = r.floor;
+                card.querySelector('.room-type').textContent = r.type;
+                const list = card.querySelector('.student-list');
+                if (r.students.length > 0) {
+                    card.querySelector('.room-empty').remove();
+                    r.students.forEach(s => {
+                        const item = itemTpl.cloneNode(true);
+                        item.querySelector('.student-name').textContent = s.name;
+                        item.querySelector('.student-sid').textContent = s.sid;
+                        item.querySelector('.badge').textContent = `Year ${s.year}`;
+                        list.appendChild(item);
+                    });
+                } else {
+                    list.remove();
+                }
+                frag.appendChild(card);
+            });
+            container.replaceChildren(frag);
+        }
+
+        // Initialize all three panes from a single round trip
+        async function bootstrap() {
+            const res = await fetch('/api/bootstrap');
+            const data = await res.json();
+            renderStats(data.stats);
+            renderRooms(data.rooms);
+            renderStudents(data.students);
         }
 
-        // Initialize
-        loadStats();
-        loadRooms();
+        bootstrap();
         
         // Refresh stats every 30 seconds
         setInterval(loadStats, 30000);
@@ -1147,54 +888,185 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </body>
 </html>"""
 
+# The page only depends on app configuration, so it is compiled and rendered once at import.
+_INDEX_HTML = app.jinja_env.from_string(HTML_TEMPLATE).render(static_url=app.static_url_path).encode("utf-8")
+_INDEX_GZ = gzip.compress(_INDEX_HTML, 9, mtime=0)  # fixed header time keeps the ETag stable
+
+
+def _index_variant(body, encoding=None):
+    etag = hashlib.md5(body).hexdigest()
+    headers = {
+        "Content-Type": "text/html; charset=utf-8",
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding",
+        "ETag": f'"{etag}"',
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return body, etag, headers
+
+
+# (body, etag, headers) per encoding, so index() only picks one and returns it.
+_INDEX_IDENTITY = _index_variant(_INDEX_HTML)
+_INDEX_GZIP = _index_variant(_INDEX_GZ, "gzip")
+_INDEX_BROTLI = _index_variant(brotli.compress(_INDEX_HTML, quality=11), "br") if brotli is not None else None
+
+# (version, serialized body, {encoding: compressed body}) for /api/stats and /api/report,
+# swapped in as one tuple so a reader never pairs a body with another version's encodings.
+_stats_cache = {"entry": None}
+_report_cache = {"entry": None}
+
+
+# A repeat POST /api/allocate arriving within _ALLOC_DEBOUNCE seconds of the last run, with
+# no mutation in between, gets that run's response instead of a second pass.
+_ALLOC_DEBOUNCE = 2.0
+_alloc_lock = threading.Lock()
+_alloc_recent = {"t": 0.0, "v": None, "body": None}
+
+
+def _json_response(body):
+    if not isinstance(body, bytes):
+        body = _dumps(body)
+    return Response(body, mimetype="application/json")
+
+
+# Serves a cached entry, compressing its body at most once per encoding instead of letting
+# Flask-Compress redo it on every request; a set Content-Encoding makes Flask-Compress skip it.
+def _cached_json_response(entry):
+    _, body, encoded = entry
+    if Compress is None or len(body) < app.config["COMPRESS_MIN_SIZE"]:
+        return _json_response(body)
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"] > 0:
+        encoding = "br"
+    elif accepted["gzip"] > 0:
+        encoding = "gzip"
+    else:
+        return _json_response(body)
+    data = encoded.get(encoding)
+    if data is None:
+        if encoding == "br":
+            data = brotli.compress(body, quality=app.config["COMPRESS_BR_LEVEL"])
+        else:
+            data = gzip.compress(body, app.config["COMPRESS_LEVEL"], mtime=0)
+        encoded[encoding] = data
+    response = _json_response(data)
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+# Distinguishes this process's version numbers from those of an earlier run.
+_BOOT_ID = os.urandom(4).hex()
+
+
+# Answers conditional GETs with 304 while HostelSystem's version is unchanged.
+def _etag_by_version(view):
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.method != 'GET':
+            return view(*args, **kwargs)
+        etag = f"{_BOOT_ID}-{hostel_sys.version}"
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = view(*args, **kwargs)
+        response.set_etag(etag, weak=True)
+        # Cached copies must be revalidated; the 304 path makes that cheap.
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+    return wrapper
+
+
+def _rooms_payload():
+    return [{
+        "number": r.number, "capacity": r.capacity, "floor": r.floor,
+        "type": r.type, "occupied": r.occupied, "available": r.capacity - r.occupied
+    } for r in hostel_sys.rooms]
+
 
 # -------------------- Routes --------------------
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    # Look up the quality rather than testing membership, so "br;q=0" counts as refused.
+    accepted = request.accept_encodings
+    if _INDEX_BROTLI is not None and accepted["br"] > 0:
+        body, etag, headers = _INDEX_BROTLI
+    elif accepted["gzip"] > 0:
+        body, etag, headers = _INDEX_GZIP
+    else:
+        body, etag, headers = _INDEX_IDENTITY
+    if etag in request.if_none_match:
+        return b"", 304, headers
+    return body, 200, headers
 
 @app.route('/api/rooms', methods=['GET', 'POST'])
+@_etag_by_version
 def rooms():
     if request.method == 'POST':
         data = request.json
         try:
             hostel_sys.add_room(data['number'], data['capacity'], data['floor'], data['type'])
-            return jsonify({"success": True, "message": "Room added successfully"})
+            return _json_response({"success": True, "message": "Room added successfully"})
         except Exception as e:
-            return jsonify({"success": False, "message": str(e)})
-    return jsonify([{
-        "number": r.number, "capacity": r.capacity, "floor": r.floor,
-        "type": r.type, "occupied": r.occupied, "available": r.capacity - r.occupied
-    } for r in hostel_sys.rooms])
+            return _json_response({"success": False, "message": str(e)})
+    return _json_response(_rooms_payload())
 
 @app.route('/api/students', methods=['GET', 'POST'])
+@_etag_by_version
 def students():
     if request.method == 'POST':
         data = request.json
         try:
             hostel_sys.add_student(data['sid'], data['name'], data['gender'], data['year'])
-            return jsonify({"success": True, "message": "Student added successfully"})
+            return _json_response({"success": True, "message": "Student added successfully"})
         except Exception as e:
-            return jsonify({"success": False, "message": str(e)})
-    return jsonify([{
-        "sid": s.sid, "name": s.name, "gender": s.gender, "year": s.year, "room": s.room
-    } for s in hostel_sys.students])
+            return _json_response({"success": False, "message": str(e)})
+    # Student's fields are exactly the response shape, so the instances are encoded as-is.
+    return _json_response(hostel_sys.students)
 
 @app.route('/api/allocate', methods=['POST'])
 def allocate():
-    return jsonify(hostel_sys.allocate_rooms())
+    with _alloc_lock:
+        if (_alloc_recent["v"] == hostel_sys.version
+                and time.monotonic() - _alloc_recent["t"] < _ALLOC_DEBOUNCE):
+            return _json_response(_alloc_recent["body"])
+        body = _dumps(hostel_sys.allocate_rooms())
+        _alloc_recent.update(t=time.monotonic(), v=hostel_sys.version, body=body)
+    return _json_response(body)
 
 @app.route('/api/stats', methods=['GET'])
+@_etag_by_version
 def stats():
-    return jsonify(hostel_sys.get_stats())
+    version = hostel_sys.version
+    entry = _stats_cache["entry"]
+    if entry is None or entry[0] != version:
+        entry = _stats_cache["entry"] = (version, _dumps(hostel_sys.get_stats()), {})
+    return _cached_json_response(entry)
+
+@app.route('/api/bootstrap', methods=['GET'])
+@_etag_by_version
+def bootstrap():
+    return _json_response({
+        "stats": hostel_sys.get_stats(),
+        "rooms": _rooms_payload(),
+        "students": hostel_sys.students
+    })
 
 @app.route('/api/report', methods=['GET'])
+@_etag_by_version
 def report():
+    version = hostel_sys.version
+    entry = _report_cache["entry"]
+    if entry is not None and entry[0] == version:
+        return _cached_json_response(entry)
     rooms_data = []
+    student_by_id = hostel_sys.get_student_by_id
     for r in hostel_sys.rooms:
         students_in_room = []
-        for sid in r.students:
-            student = hostel_sys.get_student_by_id(sid)
+        # Beds fill in order, so only the first `occupied` slots hold a sid.
+        for sid in r.students[:r.occupied]:
+            student = student_by_id(sid)
             if student:
                 students_in_room.append({
                     "sid": student.sid,
@@ -1209,7 +1081,8 @@ def report():
             "occupied": r.occupied,
             "students": students_in_room
         })
-    return jsonify(rooms_data)
+    entry = _report_cache["entry"] = (version, _dumps(rooms_data), {})
+    return _cached_json_response(entry)
 
 
 if __name__ == '__main__':
@@ -1219,4 +1092,15 @@ if __name__ == '__main__':
     print("✅ Server starting...")
     print("📍 Open your browser to: http://localhost:5000")
     print("=" * 60)
-    app.run(debug=True, port=5000, host='127.0.0.1')
\ No newline at end of file
+    if os.environ.get("FLASK_ENV") == "dev":
+        app.run(debug=True, port=5000, host='127.0.0.1')
+    else:
+        # One worker process (HostelSystem state is per process), many threads.
+        try:
+            # --chdir so "app:app" resolves to this file whatever directory we were started from.
+            os.execvp("gunicorn", ["gunicorn", "-k", "gthread", "-w", "1", "--threads", "8",
+                                   "--chdir", BASE_DIR,
+                                   "-b", "127.0.0.1:5000", "app:app"])
+        except FileNotFoundError:
+            print("⚠️  gunicorn not found, falling back to the threaded development server")
+            app.run(threaded=True, port=5000, host='127.0.0.1')
\ No newline at end of file
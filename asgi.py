@@ -0,0 +1,13 @@
+"""
+ASGI entry point
+
+    hypercorn -k uvloop -w 1 asgi:asgi_app
+
+As with wsgi.py, run a single worker so there is one HostelSystem.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
@@ -0,0 +1,149 @@
+import os
+import time
+
+import pytest
+
+import app
+from app import HostelSystem
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "DATA_FILE", str(tmp_path / "hostel_data.json"))
+    monkeypatch.setattr(app, "LOG_FILE", str(tmp_path / "hostel_data.log"))
+    return tmp_path
+
+
+def _state(h):
+    return ([r.to_dict() for r in h.rooms], [s.to_dict() for s in h.students])
+
+
+def _populated():
+    h = HostelSystem()
+    h.add_room("101", 2, 1, "Standard")
+    h.add_room("102", 1, 1, "AC")
+    h.add_student("S1", "Asha", "Female", 1)
+    h.add_student("S2", "Ravi", "Male", 2)
+    h.add_student("S3", "Meera", "Female", 3)
+    h.allocate_rooms()
+    h._flush()
+    return h
+
+
+def test_log_round_trip(workdir):
+    h = _populated()
+    assert os.path.exists(app.LOG_FILE)
+    assert _state(HostelSystem()) == _state(h)
+
+
+def test_compact_round_trip(workdir):
+    h = _populated()
+    h.compact()
+    assert not os.path.exists(app.LOG_FILE)
+    assert _state(HostelSystem()) == _state(h)
+
+    # Records written after a compaction replay on top of the new snapshot.
+    h.add_student("S4", "Kiran", "Male", 1)
+    h._flush()
+    assert _state(HostelSystem()) == _state(h)
+
+
+def test_crash_between_snapshot_and_log_removal(workdir, monkeypatch):
+    h = _populated()
+    expected = _state(h)
+    with monkeypatch.context() as m:
+        m.setattr(os, "remove", lambda path: None)
+        h.compact()
+    assert os.path.exists(app.LOG_FILE)
+
+    reloaded = HostelSystem()
+    assert _state(reloaded) == expected
+    # The stale log is dropped so later records are not appended under it.
+    assert not os.path.exists(app.LOG_FILE)
+    reloaded.add_student("S4", "Kiran", "Male", 1)
+    reloaded._flush()
+    assert _state(HostelSystem()) == _state(reloaded)
+
+
+def test_unloadable_snapshot_does_not_break_replay(workdir):
+    h = _populated()
+    h.compact()
+    h.add_student("S4", "Kiran", "Male", 1)
+    h.add_room("103", 2, 2, "Deluxe")
+    h.allocate_rooms()
+    h._flush()
+    with open(app.DATA_FILE, "w") as f:
+        f.write("{not json")
+
+    reloaded = HostelSystem()
+    assert [s.sid for s in reloaded.students] == ["S4"]
+
+
+def test_headerless_log_is_stale_after_compaction(workdir, monkeypatch):
+    h = _populated()
+    # A log from before epoch headers existed.
+    with open(app.LOG_FILE, "rb") as f:
+        lines = f.readlines()[1:]
+    with open(app.LOG_FILE, "wb") as f:
+        f.writelines(lines)
+    with monkeypatch.context() as m:
+        m.setattr(os, "remove", lambda path: None)
+        HostelSystem().compact()
+
+    assert _state(HostelSystem()) == _state(h)
+
+
+def test_torn_record_does_not_strand_later_writes(workdir):
+    h = HostelSystem()
+    h.add_student("a", "A", "Male", 1)
+    h._flush()
+    with open(app.LOG_FILE, "ab") as f:
+        f.write(b'["student",{"sid":"b","na')
+
+    reloaded = HostelSystem()
+    assert [s.sid for s in reloaded.students] == ["a"]
+    reloaded.add_student("c", "C", "Female", 2)
+    reloaded._flush()
+    assert [s.sid for s in HostelSystem().students] == ["a", "c"]
+
+
+def test_unreplayable_record_does_not_strand_later_writes(workdir):
+    h = HostelSystem()
+    h.add_student("a", "A", "Male", 1)
+    h._flush()
+    with open(app.LOG_FILE, "ab") as f:
+        f.write(b'["allocate",[[5,0]]]\n')
+
+    reloaded = HostelSystem()
+    reloaded.add_student("c", "C", "Female", 2)
+    reloaded._flush()
+    assert [s.sid for s in HostelSystem().students] == ["a", "c"]
+
+
+def test_failed_compaction_keeps_queued_records(workdir, monkeypatch):
+    h = _populated()
+    h.add_student("S4", "Kiran", "Male", 1)
+    with monkeypatch.context() as m:
+        def fail(src, dst):
+            raise OSError("disk full")
+        m.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            h.compact()
+    assert h._epoch == 0
+
+    h._flush()
+    assert _state(HostelSystem()) == _state(h)
+
+
+def test_steady_writes_are_flushed_within_max_delay(workdir):
+    h = HostelSystem()
+    deadline = time.monotonic() + app.SAVE_MAX_DELAY + 0.5
+    i = 0
+    while time.monotonic() < deadline:
+        h.add_student(f"S{i}", "S", "Male", 1)
+        i += 1
+        time.sleep(app.SAVE_DELAY / 4)
+    # Mutations never paused for SAVE_DELAY, yet some of them have reached the log.
+    assert os.path.getsize(app.LOG_FILE) > 0
+    h._flush()
+    assert len(HostelSystem().students) == i
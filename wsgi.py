@@ -0,0 +1,15 @@
+"""
+Production WSGI entry point (gevent workers)
+
+    gunicorn -k gevent -w 1 --worker-connections 1000 wsgi:app
+
+Keep a single worker process: HostelSystem holds rooms and students in
+process memory, and several workers would each serve their own copy while
+appending to the same log.
+"""
+
+# Must run before anything else imports socket/threading.
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402